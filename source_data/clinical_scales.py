@@ -2,21 +2,12 @@
 """
 Merge clinical salary scales into the salary scales file
 
-Usage:
-    ./clinical_scales.py (-h | --help)
-    ./clinical_scales.py [--output=FILE]
-
-Options:
-
-    --output=FILE, -o=FILE      Write output to FILE. If "-", use standard output. [default: -]
-
 """
+import argparse
 import csv
 import datetime
-import sys
 
-import docopt
-import yaml
+import output
 
 
 CLINICAL_NODAL_POINTS = 'clinical-nodal-points.csv'
@@ -27,9 +18,14 @@ CLINICAL_RA_AND_LECTURER_POINTS = 'clinical-research-associates-and-clinical-lec
 
 EFFECTIVE_DATE = datetime.date(2017, 4, 1)
 
+# Translation table which strips thousands separators from salaries.
+STRIP_COMMAS = str.maketrans('', '', ',')
+
 
 def main():
-    opts = docopt.docopt(__doc__)
+    parser = argparse.ArgumentParser(description=__doc__.strip())
+    output.add_arguments(parser)
+    opts = parser.parse_args()
 
     points = {}
     grades = []
@@ -41,13 +37,11 @@ def main():
         headings = next(reader)
         assert headings[1] == 'Salary (£)'
 
-        scale = []
-        for point, salary_txt in reader:
-            salary = int(salary_txt.replace(',', ''))
-            point_name = f'NODE_{point}'
-            points[point_name] = salary
-            scale.append({'isContribution': True, 'name': point_name, 'point': point_name})
-        grades.append({'name': 'CLINICAL_NODAL', 'scale': scale})
+        nodal_points = {
+            f'NODE_{point}': parse_salary(salary_txt) for point, salary_txt in reader
+        }
+        points.update(nodal_points)
+        grades.append({'name': 'CLINICAL_NODAL', 'scale': make_scale(nodal_points)})
 
     with open(CLINICAL_CONSULTANT_POINTS) as fobj:
         reader = csv.reader(fobj)
@@ -56,19 +50,18 @@ def main():
         headings = next(reader)
         assert headings[3].startswith('Basic salary at April ' + str(EFFECTIVE_DATE.year))
 
-        scale = []
+        consultant_points = {}
         prev_threshold = ''
         for this_threshold, years, _, salary_txt, _ in reader:
             if this_threshold == '':
                 threshold = prev_threshold
             else:
                 threshold = this_threshold
-            salary = int(salary_txt.replace(',', ''))
             point_name = f'CONSULTANT_THRESH_{threshold}_YEAR_{years}'
-            points[point_name] = salary
-            scale.append({'isContribution': True, 'name': point_name, 'point': point_name})
+            consultant_points[point_name] = parse_salary(salary_txt)
             prev_threshold = threshold
-        grades.append({'name': 'CLINICAL_CONSULTANT', 'scale': scale})
+        points.update(consultant_points)
+        grades.append({'name': 'CLINICAL_CONSULTANT', 'scale': make_scale(consultant_points)})
 
     with open(CLINICAL_RA_AND_LECTURER_POINTS) as fobj:
         reader = csv.reader(fobj)
@@ -77,14 +70,13 @@ def main():
         headings = next(reader)
         assert headings[1] == 'Salary (£)'
 
-        scale = []
-        for point, salary_txt in reader:
-            salary = int(salary_txt.replace(',', ''))
-            point_name = f'RA_LECTURER_{point}'
-            points[point_name] = salary
-            scale.append({'isContribution': True, 'name': point_name, 'point': point_name})
-            prev_threshold = threshold
-        grades.append({'name': 'CLINICAL_RA_AND_LECTURER', 'scale': scale})
+        ra_and_lecturer_points = {
+            f'RA_LECTURER_{point}': parse_salary(salary_txt) for point, salary_txt in reader
+        }
+        points.update(ra_and_lecturer_points)
+        grades.append({
+            'name': 'CLINICAL_RA_AND_LECTURER', 'scale': make_scale(ra_and_lecturer_points)
+        })
 
     data = {
         'grades': grades,
@@ -96,12 +88,21 @@ def main():
         ],
     }
 
-    output = yaml.dump(data)
-    if opts['--output'] is None or opts['--output'] == '-':
-        sys.stdout.write(output)
-    else:
-        with open(opts['--output'], 'w') as fobj:
-            fobj.write(output)
+    output.write(data, opts)
+
+
+def parse_salary(salary_txt):
+    return int(salary_txt.translate(STRIP_COMMAS))
+
+
+def make_scale(points):
+    # The scale is written as parallel lists of row fields. Dicts preserve insertion order and so
+    # the scale follows the order of the CSV file.
+    return {
+        'isContribution': [True] * len(points),
+        'names': list(points),
+        'points': list(points),
+    }
 
 
 if __name__ == '__main__':
@@ -2,48 +2,50 @@
 """
 Extract the first HTML document from a project light web-page as CSV.
 
-Usage:
-    h2ml2csv.py (-h | --help)
-    h2ml2csv.py [--output=FILE] <input>
-
-Options:
-
-    --output=FILE, -o=FILE      Write output to FILE. If "-", use standard output. [default: -]
-
 """
+import argparse
 import csv
 import sys
 
-import bs4
-import docopt
+from lxml import html as lxml_html
+
+# XPath expression matching the first table within the page content.
+CONTENT_TABLE_XPATH = (
+    "(//div[contains(concat(' ', normalize-space(@class), ' '), ' content ')]//table)[1]"
+)
 
 
 def main():
     # Parse command line options
-    opts = docopt.docopt(__doc__)
+    parser = argparse.ArgumentParser(description=__doc__.strip())
+    parser.add_argument(
+        '--output', '-o', metavar='FILE', default='-',
+        help='Write output to FILE. If "-", use standard output. (default: %(default)s)')
+    parser.add_argument('input', help='HTML document')
+    opts = parser.parse_args()
 
     # Load HTML file
-    with open(opts['<input>']) as f:
-        soup = bs4.BeautifulSoup(f, 'html5lib')
+    with open(opts.input) as f:
+        document = lxml_html.document_fromstring(f.read())
 
     # Find table
-    table = soup.find('div', class_='content').find('table')
+    table = document.xpath(CONTENT_TABLE_XPATH)[0]
 
-    if opts['--output'] is None or opts['--output'] == '-':
+    if opts.output == '-':
         write_table(table, sys.stdout)
     else:
-        with open(opts['--output'], 'w') as f:
+        with open(opts.output, 'w') as f:
             write_table(table, f)
 
 
 def write_table(table, fobj):
     writer = csv.writer(fobj)
 
-    writer.writerow(th.text for th in table.find('thead').find_all('th'))
-    writer.writerows(
-        (td.text.strip() for td in tr.find_all('td'))
-        for tr in table.find('tbody').find_all('tr')
-    )
+    writer.writerow(th.text_content() for th in table.find('thead').iter('th'))
+
+    # Rows are written as they are visited rather than being collected into a list first.
+    for tr in table.find('tbody').iter('tr'):
+        writer.writerow(td.text_content().strip() for td in tr.iter('td'))
 
 
 if __name__ == '__main__':
@@ -0,0 +1,57 @@
+"""
+Write data generated by the scripts in this directory in a choice of output formats
+
+"""
+import json
+import sys
+
+import yaml
+
+# Use the libyaml-backed emitter if PyYAML was built with it.
+try:
+    from yaml import CSafeDumper as Dumper
+except ImportError:
+    from yaml import SafeDumper as Dumper
+
+
+def add_arguments(parser):
+    """
+    Add the --output and --output-format options to an :py:class:`argparse.ArgumentParser`.
+
+    """
+    parser.add_argument(
+        '--output', '-o', metavar='FILE', default='-',
+        help='Write output to FILE. If "-", use standard output. (default: %(default)s)')
+    parser.add_argument(
+        '--output-format', choices=sorted(OUTPUT_FORMATS), default='yaml',
+        help='Output format. (default: %(default)s)')
+
+
+def write(data, opts):
+    """
+    Write *data* as specified by the options added by :py:func:`add_arguments`.
+
+    """
+    dump = OUTPUT_FORMATS[opts.output_format]
+    if opts.output == '-':
+        dump(data, sys.stdout)
+    else:
+        with open(opts.output, 'w') as fobj:
+            dump(data, fobj)
+
+
+def dump_yaml(data, fobj):
+    # Keys are written in insertion order rather than being sorted. Collections of scalars are
+    # written in the compact flow style.
+    yaml.dump(
+        data, fobj, Dumper=Dumper, sort_keys=False, default_flow_style=None, width=120)
+
+
+def dump_json(data, fobj):
+    # Dates cannot be represented in JSON and so are written as ISO 8601 strings.
+    json.dump(data, fobj, default=str, indent=2)
+    fobj.write('\n')
+
+
+# Functions which write data to a file object keyed by output format.
+OUTPUT_FORMATS = {'yaml': dump_yaml, 'json': dump_json}
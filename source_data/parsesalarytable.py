@@ -2,25 +2,16 @@
 """
 Convert salary spine Excel table to a machine-readable format
 
-Usage:
-    parsesalarytable.py (-h | --help)
-    parsesalarytable.py [--output=<output>] <input>
-
-Options:
-
-    --output=FILE, -o=FILE      Write output to FILE. If "-", use standard output. [default: -]
-
 """
+import argparse
 import fractions
 import itertools
-import math
 import re
-import sys
 
 import dateparser
-import docopt
 import openpyxl
-import yaml
+
+import output
 
 # NOTE: these row and column indices are 1-based :(.
 
@@ -53,20 +44,21 @@ DATA_VALID_PATTERN = re.compile(r'^(?P<increment>T?[0-9]+)?(?P<contribution>\*)?
 
 def main():
     # Parse command line options
-    opts = docopt.docopt(__doc__)
-
-    # Load first sheet from workbook
-    workbook = openpyxl.load_workbook(opts['<input>'])
+    parser = argparse.ArgumentParser(description=__doc__.strip())
+    output.add_arguments(parser)
+    parser.add_argument('input', help='Salary spine Excel workbook')
+    opts = parser.parse_args()
+
+    # Load first sheet from workbook. We only need cell values and so the workbook is streamed in
+    # read-only mode with formulae replaced by their cached values.
+    workbook = openpyxl.load_workbook(opts.input, read_only=True, data_only=True)
     sheet = workbook[workbook.sheetnames[0]]
 
     # Convert sheet to output table
     output_data = convert(sheet)
+    workbook.close()
 
-    if opts['--output'] == '-':
-        yaml.dump(output_data, sys.stdout)
-    else:
-        with open(opts['--output'], 'w') as fobj:
-            yaml.dump(output_data, fobj)
+    output.write(output_data, opts)
 
 
 def convert(sheet):
@@ -78,11 +70,24 @@ def convert(sheet):
     # An iterator which iterates over point values
     points = range(POINT_VALUE_RANGE[1], POINT_VALUE_RANGE[0]-1, -1)
 
+    # Random cell access is slow for read-only worksheets and so cells are only ever read by
+    # iterating over rows of values. Rows read start at the first data column and so a cell in
+    # column col_idx is at offset col_idx-DATA_START_COL.
+    max_col_idx = max(SALARY_MAPPING_COLUMNS)
+
+    # Read the rows containing the salary mapping titles.
+    first_title_row_idx = min(row_idx for row_idx, _ in SALARY_MAPPING_TITLES)
+    title_rows = list(sheet.iter_rows(
+        min_row=first_title_row_idx, max_row=max(row_idx for row_idx, _ in SALARY_MAPPING_TITLES),
+        min_col=DATA_START_COL, max_col=max_col_idx, values_only=True
+    ))
+
     # A list of effective dates for each salary mapping column. Note that we require that the cell
     # be of the form "from <date>".
     salary_map_effective_dates = [
         dateparser.parse(
-            sheet.cell(row=row_idx, column=col_idx).value.lower().replace('from', '').strip()
+            title_rows[row_idx-first_title_row_idx][col_idx-DATA_START_COL]
+            .lower().replace('from', '').strip()
         ).date()
         for row_idx, col_idx in SALARY_MAPPING_TITLES
     ]
@@ -92,50 +97,97 @@ def convert(sheet):
         effective_date: {} for effective_date in salary_map_effective_dates
     }
 
-    # Initialise an empty list of salary scales for each grade. Note that, because of the order in
-    # which the table is processed this is in reverse order of progression. This is fixed when the
-    # final data table is produced.
-    grade_scales = {key: [] for key in GRADE_KEYS}
+    # Initialise an empty salary scale for each grade. Scales are recorded as parallel lists of row
+    # fields. Note that, because of the order in which the table is processed this is in reverse
+    # order of progression. This is fixed when the final data table is produced.
+    grade_scales = {
+        key: {'isContribution': [], 'names': [], 'points': []} for key in GRADE_KEYS
+    }
+
+    # Pair the output for each salary mapping column and grade column with the offset of that
+    # column within a row so that each row can be dispatched without further lookups.
+    salary_map_offsets = [
+        (salary_maps[date], col_idx-DATA_START_COL)
+        for date, col_idx in zip(salary_map_effective_dates, SALARY_MAPPING_COLUMNS)
+    ]
+    grade_scale_offsets = [
+        (grade_scales[grade_key], offset) for offset, grade_key in enumerate(GRADE_KEYS)
+    ]
 
-    for point, row_idx in zip(points, itertools.count(DATA_START_ROW)):
+    match_data = DATA_VALID_PATTERN.match
+
+    # Stream the data rows rather than reading them all up front. Read-only worksheets stop
+    # yielding rows after the last populated row and so the stream is padded with empty rows to
+    # make sure that every point is present in the output.
+    data_rows = itertools.chain(
+        sheet.iter_rows(
+            min_row=DATA_START_ROW, max_row=DATA_START_ROW+len(points)-1,
+            min_col=DATA_START_COL, max_col=max_col_idx, values_only=True
+        ),
+        itertools.repeat((None,) * (max_col_idx - DATA_START_COL + 1))
+    )
+
+    for point, row in zip(points, data_rows):
         # Note: since point values are monotonic integers it is tempting to perform increments by
         # simply incrementing the point value. This is, strictly speaking, wrong since one must
         # only increment with regard to the salary scale for a particular grade. To guard against
         # this we use string keys for the points which cannot easily be incremented inadvertently.
-
-        # Read the point -> salary mapping for each salary mapping column.
-        for date, col_idx in zip(salary_map_effective_dates, SALARY_MAPPING_COLUMNS):
-            salary_maps[date][f'POINT_{point}'] = normalise_salary(
-                sheet.cell(row=row_idx, column=col_idx).value
-            )
+        point_name = f'POINT_{point}'
 
         # Look to see if this point is part of any grade.
-        for grade_key, col_idx in zip(GRADE_KEYS, itertools.count(DATA_START_COL)):
+        in_any_grade = False
+        for grade_scale, offset in grade_scale_offsets:
             # Read the corresponding cell.
-            cell = sheet.cell(row=row_idx, column=col_idx)
+            value = row[offset]
 
             # If this cell is empty, this point is not part of the grade.
-            if cell.value is None:
+            if value is None:
                 continue
 
-            # Extract the textual representation of the cell
-            cell_text = str(cell.value).strip()
+            if type(value) is int and value >= 0:
+                # Most cells are plain increment numbers which are read as integers. These always
+                # match DATA_VALID_PATTERN and never mark a contribution point.
+                increment, is_contribution = str(value), False
+            else:
+                # Extract the textual representation of the cell
+                cell_text = str(value).strip()
 
-            # We need to match the cell value against DATA_VALID_PATTERN since some cells are
-            # non-empty but are not part of the grade. These are the grade "labels" which are,
-            # annoyingly, placed in the data table itself.
-            match = DATA_VALID_PATTERN.match(cell_text)
-            if not match:
-                continue
+                # We need to match the cell value against DATA_VALID_PATTERN since some cells are
+                # non-empty but are not part of the grade. These are the grade "labels" which are,
+                # annoyingly, placed in the data table itself.
+                match = match_data(cell_text)
+                if not match:
+                    continue
+
+                increment = match.group('increment')
+                is_contribution = match.group('contribution') is not None
 
             # Record the presence of this point in this grade.
-            grade_scales[grade_key].append({
-                'point': f'POINT_{point}', 'name': match.group('increment'),
-                'isContribution': match.group('contribution') is not None,
-            })
+            grade_scale['isContribution'].append(is_contribution)
+            grade_scale['names'].append(increment)
+            grade_scale['points'].append(point_name)
+            in_any_grade = True
+
+        # Read the point -> salary mapping for each salary mapping column. Formulae are replaced
+        # by their cached values and so a formula which has never been calculated reads as an
+        # empty cell. An empty salary for a point which is part of a grade is an error rather than
+        # a zero salary.
+        for salary_map, offset in salary_map_offsets:
+            value = row[offset]
+            if value is None and in_any_grade:
+                raise ValueError(f'No salary for {point_name} which is part of a grade')
+            salary_map[point_name] = normalise_salary(value)
 
     # Return the final data table.
     return {
+        'grades': [
+            {
+                'name': grade_key,
+                # reverse each field so that the scale is in increment order
+                'scale': {field: values[::-1] for field, values in scale.items()},
+            }
+            for grade_key, scale in grade_scales.items()
+        ],
         'salaries': [
             {
                 'effectiveDate': effective_date,
@@ -143,13 +195,6 @@ def convert(sheet):
             }
             for effective_date, salary_map in salary_maps.items()
         ],
-        'grades': [
-            {
-                'name': grade_key,
-                'scale': scale[::-1],  # so that the scale is in increment order
-            }
-            for grade_key, scale in grade_scales.items()
-        ],
     }
 
 
@@ -169,12 +214,18 @@ def _excel_round(n):
     the tables produced by HR.)
 
     """
-    # Ensure input is a rational
-    n = fractions.Fraction(n)
-    if n.denominator == 2:
-        # always round up halves
-        return math.ceil(n)
-    return round(n)
+    # Integers are already rounded. Note that bool is deliberately not matched here.
+    if type(n) is int:
+        return n
+
+    # Ensure input is a rational. Fractions are used directly rather than being re-constructed.
+    # Floats are converted exactly since adding a half in floating point can itself round.
+    if not isinstance(n, fractions.Fraction):
+        n = fractions.Fraction(n)
+
+    # Since halves always round up, the result is floor(n + 1/2) which can be computed exactly from
+    # the numerator and denominator using integer arithmetic.
+    return (2 * n.numerator + n.denominator) // (2 * n.denominator)
 
 
 if __name__ == '__main__':
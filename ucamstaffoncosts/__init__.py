@@ -10,6 +10,7 @@ import datetime
 import fractions
 
 from . import costs
+from . import util
 
 from .costs import Scheme, Cost
 from .salary.progression import SalaryRecord
@@ -107,26 +108,24 @@ def employment_expenditure_and_commitments(until_date, initial_grade, initial_po
         start_date = salaries[0].date
         end_date = salaries[-1].date
 
-        tax_year_start_date = datetime.date(
-            year, tax_year_start_month, tax_year_start_day)
-        tax_year_end_date = datetime.date(
-            year+1, tax_year_start_month, tax_year_start_day)
-        tax_year_days = (tax_year_end_date - tax_year_start_date).days
+        tax_year_days = util.tax_year_days(year, tax_year_start_month)
 
         # Should never get salary records after until_date
         assert end_date <= until_date
 
-        # Compute total earnings earned *after or on* the from_date.
-        earnings_after_from_date = fractions.Fraction(0, 1)
-        for salary_start, salary_end in zip(salaries, salaries[1:]):
+        # Compute total earnings earned *after or on* the from_date. The sum of day-weighted
+        # salaries is accumulated as an integer and scaled by occupancy and tax year length once.
+        scaled_earnings = 0
+        for salary_start, salary_end in util.pairwise(salaries):
             salary_start_date = max(salary_start.date, from_date)
             salary_end_date = max(salary_start_date, salary_end.date)
 
             # how many days in this range?
             days = (salary_end_date - salary_start_date).days
-            earnings_after_from_date += fractions.Fraction(
-                days * salary_start.base_salary, tax_year_days) * occupancy_fraction
-        earnings_after_from_date = round(earnings_after_from_date)
+            scaled_earnings += days * salary_start.base_salary
+        earnings_after_from_date = round(fractions.Fraction(
+            scaled_earnings * occupancy_fraction.numerator,
+            tax_year_days * occupancy_fraction.denominator))
         assert earnings_after_from_date >= 0
         assert earnings_after_from_date <= cost.salary
 
@@ -189,3 +188,4 @@ class CommitmentExplanation(_CommitmentExplanation):
 
         A :py:class:`~.Cost` tuple explaining the total cost of employment for the tax year.
     """
+    __slots__ = ()
@@ -181,11 +181,12 @@ import collections
 import datetime
 import enum
 import fractions
+import functools
 import itertools
-import math
 
 from . import tax
 from . import pension
+from . import util
 from .salary import progression
 
 
@@ -269,6 +270,7 @@ class Cost(_Cost):
         Which year's table was used to calculate these costs.
 
     """
+    __slots__ = ()
 
 
 #: Special value to pass to :py:func:`~.cost` to represent the latest tax year which has an
@@ -287,15 +289,44 @@ def calculate_cost(base_salary, scheme, year=LATEST):
     :raises NotImplementedError: if there is not an implementation for the specified tax year and
         pension scheme.
 
+    """
+    return _calculator_for(year, scheme)(base_salary)
+
+
+def calculate_costs(base_salaries, scheme, year=LATEST):
+    """
+    Return a list of :py:class:`Cost` instances, one for each base salary in *base_salaries*. This
+    is equivalent to calling :py:func:`~.calculate_cost` for each salary but the calculator for the
+    tax year and pension scheme is only looked up once.
+
+    :param base_salaries: base salaries of employees
+    :type base_salaries: iterable of int
+    :param Scheme scheme: pension scheme
+    :param int year: tax year
+
+    :raises NotImplementedError: if there is not an implementation for the specified tax year and
+        pension scheme.
+
+    >>> [cost.total for cost in calculate_costs([25000, 30000], scheme=Scheme.USS, year=2018)]
+    [31912, 38527]
+
+    """
+    return list(map(_calculator_for(year, scheme), base_salaries))
+
+
+def _calculator_for(year, scheme):
+    """
+    Return the on-cost calculator for a given tax year and pension scheme. The special value
+    :py:const:`~.LATEST` is accepted for *year*.
+
     """
     year = _LATEST_TAX_YEAR if year is LATEST else year
 
-    try:
-        calculator = _ON_COST_CALCULATORS[year][scheme]
-    except KeyError:
+    calculator = _ON_COST_CALCULATORS_BY_YEAR_AND_SCHEME.get((year, scheme))
+    if calculator is None:
         raise NotImplementedError()
 
-    return calculator(base_salary)
+    return calculator
 
 
 def costs_by_tax_year(from_year, initial_grade, initial_point, scheme,
@@ -350,9 +381,26 @@ def costs_by_tax_year(from_year, initial_grade, initial_point, scheme,
     """
     occupancy_fraction = fractions.Fraction(occupancy)
 
-    for year in itertools.count(from_year):
-        from_date = datetime.date(year, tax_year_start_month, tax_year_start_day)
-        to_date = datetime.date(year+1, tax_year_start_month, tax_year_start_day)
+    # Each tax year starts when the previous one ends and so only the end date need be constructed
+    # for each year.
+    next_from_date = datetime.date(from_year, tax_year_start_month, tax_year_start_day)
+
+    # The anniversary date is advanced as the tax years are iterated over.
+    anniversary_date = next_anniversary_date
+
+    # If there is an until date, the last tax year is the one in which it falls or, if it is the
+    # first day of a tax year, the one before.
+    if until_date is not None:
+        last_year = until_date.year
+        if (until_date.month, until_date.day) <= (tax_year_start_month, tax_year_start_day):
+            last_year -= 1
+        years = range(from_year, last_year + 1)
+    else:
+        years = itertools.count(from_year)
+
+    for year in years:
+        from_date = next_from_date
+        to_date = next_from_date = datetime.date(year+1, tax_year_start_month, tax_year_start_day)
 
         if start_date is not None and start_date >= from_date and start_date < to_date:
             # Employee start date is within this tax year
@@ -363,11 +411,12 @@ def costs_by_tax_year(from_year, initial_grade, initial_point, scheme,
             initial_reason = 'start of tax year'
 
         if until_date is not None and initial_date >= until_date:
-            # we're done
+            # we're done. This can happen before the last year if the employee starts after the
+            # until date.
             return
 
         # Total number of days in year
-        tax_year_days = (to_date - from_date).days
+        tax_year_days = util.tax_year_days(year, tax_year_start_month)
 
         if until_date is not None and until_date <= to_date:
             to_date = until_date
@@ -375,15 +424,15 @@ def costs_by_tax_year(from_year, initial_grade, initial_point, scheme,
         else:
             ends_on_tax_year = True
 
-        # If we have an anniversary date which precedes this tax year, advance it by years until it
-        # is within this tax year
-        anniversary_date = next_anniversary_date
-        if anniversary_date is not None:
-            while anniversary_date < from_date:
-                anniversary_date = datetime.date(
-                    anniversary_date.year+1, anniversary_date.month, anniversary_date.day)
+        # If we have an anniversary date which precedes this tax year, advance it by whole years so
+        # that it is within this tax year. Moving it to the year in which the tax year starts will
+        # leave it at most one year short.
+        if anniversary_date is not None and anniversary_date < from_date:
+            anniversary_date = anniversary_date.replace(year=from_date.year)
+            if anniversary_date < from_date:
+                anniversary_date = anniversary_date.replace(year=from_date.year+1)
 
-        salaries = list(progression.salary_progression(
+        salaries = list(_salary_progression(
             initial_date, initial_grade, initial_point, initial_reason=initial_reason,
             until_date=to_date, next_anniversary_date=anniversary_date, **kwargs
         ))
@@ -401,15 +450,18 @@ def costs_by_tax_year(from_year, initial_grade, initial_point, scheme,
             mapping_table_date=end_salary.mapping_table_date
         ))
 
-        # Sum up per-day salaries
-        total_salary = fractions.Fraction(0, 1)
-        for start, end in zip(salaries, salaries[1:]):
+        # Sum up per-day salaries. The sum is accumulated as an integer and divided by the length
+        # of the tax year only once.
+        day_weighted_salary = 0
+        for start, end in util.pairwise(salaries):
             # how many days in this range?
             days = (end.date - start.date).days
-            total_salary += fractions.Fraction(days * start.base_salary, tax_year_days)
+            day_weighted_salary += days * start.base_salary
 
         # Compute total salary earned this year taking into account occupancy
-        total_salary = round(total_salary * occupancy_fraction)
+        total_salary = round(fractions.Fraction(
+            day_weighted_salary * occupancy_fraction.numerator,
+            tax_year_days * occupancy_fraction.denominator))
 
         # Attempt to use this tax year for on-cost calculation, falling back to LATEST
         try:
@@ -420,9 +472,33 @@ def costs_by_tax_year(from_year, initial_grade, initial_point, scheme,
         yield year, calculated_cost, salaries
 
 
+@functools.lru_cache(maxsize=1024)
+def _salary_progression(*args, **kwargs):
+    """
+    A memoised version of :py:func:`ucamstaffoncosts.salary.progression.salary_progression` which
+    returns a tuple of salary records. Employees sharing a grade, point and anniversary have the
+    same progression within a tax year.
+
+    """
+    return tuple(progression.salary_progression(*args, **kwargs))
+
+
+#: Number of results cached by each cost calculator returned from :py:func:`~._cost_calculator`.
+_CALCULATOR_CACHE_SIZE = 4096
+
+
+def _zero(_):
+    """
+    A callback for :py:func:`~._cost_calculator` which always returns zero. It is used as the
+    default for callbacks which are not required so that they may be recognised by identity.
+
+    """
+    return 0
+
+
 def _cost_calculator(tax_year, employer_nic_cb,
-                     employer_pension_cb=lambda _: 0,
-                     exchange_cb=lambda _: 0,
+                     employer_pension_cb=_zero,
+                     exchange_cb=_zero,
                      apprenticeship_levy_cb=tax.standard_apprenticeship_levy):
     """
     Return a callable which will calculate an Cost entry from a base salary. Arguments which are
@@ -440,21 +516,37 @@ def _cost_calculator(tax_year, employer_nic_cb,
         salary.
 
     """
-    def _calculate(base_salary):
-        # Ensure base salary is a rational
-        base_salary = fractions.Fraction(base_salary)
-
-        # We use the convention that the salary exchange value is negative to match the exchange
-        # column in HR tables.
-        exchange = -exchange_cb(base_salary)
+    # Bind frequently used globals to locals of the closure since the returned callable is called
+    # for every salary in a projection.
+    Fraction = fractions.Fraction
+    excel_round = _excel_round
 
-        # The employer pension contribution is the contribution based on base salary along with
-        # the employee contribution sacrificed from their salary.
-        employer_pension = employer_pension_cb(base_salary) - exchange
+    # Schemes with no salary exchange have no sacrifice to add back on or subtract.
+    has_exchange = exchange_cb is not _zero
 
-        # the taxable salary is the base less the amount sacrificed. HR would appear to round the
-        # sacrifice first
-        taxable_salary = base_salary + _excel_round(exchange)
+    def _calculate(base_salary):
+        # Ensure base salary is a rational. Integer salaries, the usual case, are already exact
+        # and are kept as integers so that they need no conversion or rounding.
+        if type(base_salary) is not int:
+            base_salary = Fraction(base_salary)
+
+        if has_exchange:
+            # We use the convention that the salary exchange value is negative to match the
+            # exchange column in HR tables.
+            exchange = -exchange_cb(base_salary)
+
+            # The employer pension contribution is the contribution based on base salary along
+            # with the employee contribution sacrificed from their salary.
+            employer_pension = employer_pension_cb(base_salary) - exchange
+
+            # the taxable salary is the base less the amount sacrificed. HR would appear to round
+            # the sacrifice first
+            rounded_exchange = excel_round(exchange)
+            taxable_salary = base_salary + rounded_exchange
+        else:
+            exchange = rounded_exchange = 0
+            employer_pension = employer_pension_cb(base_salary)
+            taxable_salary = base_salary
 
         # The employer's NIC is calculated on the taxable salary.
         employer_nic = employer_nic_cb(taxable_salary)
@@ -462,32 +554,40 @@ def _cost_calculator(tax_year, employer_nic_cb,
         # The Apprenticeship Levy is calculated on the taxable salary.
         apprenticeship_levy = apprenticeship_levy_cb(taxable_salary)
 
-        # The total is calculated using the rounded values.
+        # Round each value once. Note the odd rounding for exchange. This matters since the tables
+        # HR generate seem to include -_excel_round(-exchange) even though the total column is
+        # calculated using _excel_round(exchange). Since Excel always rounds halves up, this means
+        # that _excel_round(exchange) does not, in general, equal -_excel_round(-exchange) as you
+        # might expect. Caveat programmer!
+        rounded_salary = excel_round(base_salary)
+        reported_exchange = -excel_round(-exchange)
+        rounded_employer_pension = excel_round(employer_pension)
+        rounded_employer_nic = excel_round(employer_nic)
+        rounded_apprenticeship_levy = excel_round(apprenticeship_levy)
+
+        # The total is calculated using the rounded values and so is already a whole number.
         total = (
-            _excel_round(base_salary)
-            + _excel_round(exchange)
-            + _excel_round(employer_pension)
-            + _excel_round(employer_nic)
-            + _excel_round(apprenticeship_levy)
+            rounded_salary
+            + rounded_exchange
+            + rounded_employer_pension
+            + rounded_employer_nic
+            + rounded_apprenticeship_levy
         )
 
-        # Round all of the values. Note the odd rounding for exchange. This matters since the
-        # tables HR generate seem to include -_excel_round(-exchange) even though the total column
-        # is calculated using _excel_round(exchange). Since Excel always rounds halves up, this
-        # means that _excel_round(exchange) does not, in general, equal -_excel_round(-exchange) as
-        # you might expect. Caveat programmer!
-
         return Cost(
-            salary=_excel_round(base_salary),
-            exchange=-_excel_round(-exchange),
-            employer_pension=_excel_round(employer_pension),
-            employer_nic=_excel_round(employer_nic),
-            apprenticeship_levy=_excel_round(apprenticeship_levy),
-            total=_excel_round(total),
+            salary=rounded_salary,
+            exchange=reported_exchange,
+            employer_pension=rounded_employer_pension,
+            employer_nic=rounded_employer_nic,
+            apprenticeship_levy=rounded_apprenticeship_levy,
+            total=total,
             tax_year=tax_year,
         )
 
-    return _calculate
+    # The calculation is a pure function of the base salary. Salaries repeat many times over
+    # projections for employees sharing a grade and so cache the results. Yearly totals vary with
+    # start dates and occupancy and so the cache is sized well beyond the number of spine points.
+    return functools.lru_cache(maxsize=_CALCULATOR_CACHE_SIZE)(_calculate)
 
 
 def _excel_round(n):
@@ -498,13 +598,24 @@ def _excel_round(n):
     (The jury is out about whether Excel really rounds away from zero or up but rounding up matches
     the tables produced by HR.)
 
+    >>> [_excel_round(n) for n in (2, fractions.Fraction(5, 2), fractions.Fraction(-5, 2), 2.4)]
+    [2, 3, -2, 2]
+    >>> [_excel_round(n) for n in (-2.5, 0.49999999999999994, True)]
+    [-2, 0, 1]
+
     """
-    # Ensure input is a rational
-    n = fractions.Fraction(n)
-    if n.denominator == 2:
-        # always round up halves
-        return math.ceil(n)
-    return round(n)
+    # Integers are already rounded. Note that bool is deliberately not matched here.
+    if type(n) is int:
+        return n
+
+    # Ensure input is a rational. Fractions are used directly rather than being re-constructed.
+    # Floats are converted exactly since adding a half in floating point can itself round.
+    if not isinstance(n, fractions.Fraction):
+        n = fractions.Fraction(n)
+
+    # Since halves always round up, the result is floor(n + 1/2) which can be computed exactly from
+    # the numerator and denominator using integer arithmetic.
+    return (2 * n.numerator + n.denominator) // (2 * n.denominator)
 
 
 #: On cost calculators keyed initially by year and then by scheme identifier.
@@ -577,4 +688,12 @@ _ON_COST_CALCULATORS = {
     },
 }
 
+#: On cost calculators keyed by (year, scheme identifier) pairs so that a calculator may be found
+#: with a single lookup.
+_ON_COST_CALCULATORS_BY_YEAR_AND_SCHEME = {
+    (year, scheme): calculator
+    for year, calculators in _ON_COST_CALCULATORS.items()
+    for scheme, calculator in calculators.items()
+}
+
 _LATEST_TAX_YEAR = max(_ON_COST_CALCULATORS.keys())
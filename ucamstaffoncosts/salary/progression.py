@@ -66,8 +66,10 @@ are made on the employment anniversary.
 import collections
 import datetime
 import fractions
+import functools
 import heapq
 import itertools
+import operator
 
 from . import scales
 
@@ -106,6 +108,7 @@ class SalaryRecord(_SalaryRecord):
         salary mapping table used
 
     """
+    __slots__ = ()
 
 
 def salary_progression(from_date, initial_grade, initial_point, initial_reason=None,
@@ -195,6 +198,8 @@ class Salary(_Salary):
         the mapping table used.
 
     """
+    __slots__ = ()
+
     def __new__(cls, grade, point, base_per_annum=None, as_of_date=None):
         return super().__new__(cls, grade, point, base_per_annum, as_of_date)
 
@@ -238,6 +243,7 @@ class SalaryChange(_SalaryChange):
         reason for the change.
 
     """
+    __slots__ = ()
 
 
 def fold(changes, initial_salary=None, elide_null_changes=True):
@@ -349,6 +355,14 @@ def map_grade_and_points(changes, salary_mapping_tables_kwargs={}):
     2022-06-01   | anniversary: no increment           | Grade.GRADE_2    | P5    |   17,017
     2022-08-01   | new salary table (approximate)      | Grade.GRADE_2    | P5    |   17,357
 
+    Changes may be collected before they are folded:
+
+    >>> salaries = list(until(datetime.date(2018, 1, 1), map_grade_and_points(
+    ...     set_salary(start_date, grade, point),
+    ...     salary_mapping_tables_kwargs={'table': EXAMPLE_SALARY_SCALES})))
+    >>> [row.base_salary for row in fold(salaries)]
+    [14767, 15126]
+
     Passing an empty iterable works as you'd expect:
 
     >>> list(map_grade_and_points([]))
@@ -399,13 +413,15 @@ def map_grade_and_points(changes, salary_mapping_tables_kwargs={}):
             assert False, 'should not be reached'  # pragma: no cover
 
         if current_salary is not None:
-            yield SalaryChange(date=date, update_salary=(
-                lambda _: (
-                    current_salary.with_base(
-                        current_mapping[current_salary.point], current_mapping_date
-                    ), reason
-                )
-            ))
+            # The mapped salary is computed now rather than when update_salary is called so that
+            # the change does not depend on the loop variables. Note: the s=salary_and_reason is
+            # necessary because lambdas capture by *reference*, not value.
+            salary_and_reason = (
+                current_salary.with_base(current_mapping[current_salary.point],
+                                         current_mapping_date),
+                reason
+            )
+            yield SalaryChange(date=date, update_salary=lambda _, s=salary_and_reason: s)
 
 
 def compose_changes(*change_iterables):
@@ -414,12 +430,9 @@ def compose_changes(*change_iterables):
     which yields the changes in ascending date order.
 
     """
-    mapped_change_iterables = [
-        ((change.date, change) for change in iterable)
-        for iterable in change_iterables
-    ]
-    for _, _, change in merge_priority_iterables(mapped_change_iterables):
-        yield change
+    # heapq.merge() is stable and so changes with the same date are yielded in the order of
+    # *change_iterables* as they would be by merge_priority_iterables().
+    return heapq.merge(*change_iterables, key=operator.attrgetter('date'))
 
 
 def until(end_date, changes):
@@ -448,7 +461,16 @@ def until(end_date, changes):
     if not isinstance(end_date, datetime.date):
         raise TypeError('until must be passed a date object')
 
-    return itertools.takewhile(lambda c: c.date < end_date, changes)
+    # The changes are in ascending date order and so iteration stops at the first change on or
+    # after the end date. A nested generator is used so that the type check above happens
+    # immediately.
+    def _until():
+        for change in changes:
+            if change.date >= end_date:
+                return
+            yield change
+
+    return _until()
 
 
 def anniversary_increments(next_anniversary_date, table=scales.SALARY_SCALES):
@@ -477,15 +499,17 @@ def anniversary_increments(next_anniversary_date, table=scales.SALARY_SCALES):
 
     month, day = next_anniversary_date.month, next_anniversary_date.day
 
+    # The update is the same for every anniversary and so it is only defined once.
+    def update_salary(previous_salary):
+        grade, point = previous_salary.grade, previous_salary.point
+        new_point = table.increment(grade, point)
+        if new_point == point:
+            return (previous_salary, 'anniversary: no increment')
+        return (Salary(grade, new_point),
+                'anniversary: point {} to {}'.format(
+                    point, new_point))
+
     for year in itertools.count(next_anniversary_date.year):
-        def update_salary(previous_salary):
-            grade, point = previous_salary.grade, previous_salary.point
-            new_point = table.increment(grade, point)
-            if new_point == point:
-                return (previous_salary, 'anniversary: no increment')
-            return (Salary(grade, new_point),
-                    'anniversary: point {} to {}'.format(
-                        point, new_point))
         yield SalaryChange(date=datetime.date(year, month, day), update_salary=update_salary)
 
 
@@ -569,16 +593,29 @@ def merge_priority_iterables(iterables):
     (datetime.date(2018, 6, 30), 2, 'it3_6'), (datetime.date(2018, 7, 30), 2, 'it3_7')]
 
     """
-    # The implementation is a thin wrapper around heapq.merge() which nearly does everything we
-    # need. We modify the iterables' values to be (deadline, iterable index, value) We insert
-    # "iterable index" here as a tie-break value to ensure that the ordering of values with equal
-    # deadline is deterministic and follows the documentation above. This also means that the
-    # values need not be comparable since the tuple comparison will stop at the iterable index.
-    return heapq.merge(*[
-        # note: the idx=idx is necessary because lambdas capture by *reference*, not value
-        map(lambda v, idx=idx: (v[0], idx) + v[1:], iter(it))
-        for idx, it in enumerate(iterables)
-    ])
+    # The queue is a heap of (deadline, iterable index, value, iterator) entries with one entry for
+    # each iterable which is not yet exhausted. The "iterable index" is a tie-break value which
+    # ensures that the ordering of values with equal deadline is deterministic and follows the
+    # documentation above. Since each index appears in the heap at most once, this also means that
+    # the values need not be comparable since the tuple comparison will stop at the index.
+    heap = []
+    for idx, iterable in enumerate(iterables):
+        iterator = iter(iterable)
+        for value in iterator:
+            heap.append((value[0], idx, value, iterator))
+            break
+    heapq.heapify(heap)
+
+    while heap:
+        deadline, idx, value, iterator = heap[0]
+        yield (deadline, idx) + value[1:]
+
+        # Replace the entry with the next value from the same iterable or drop it if there is none.
+        for value in iterator:
+            heapq.heapreplace(heap, (value[0], idx, value, iterator))
+            break
+        else:
+            heapq.heappop(heap)
 
 
 def salary_mapping_tables(from_date, table=scales.SALARY_SCALES,
@@ -615,7 +652,7 @@ def salary_mapping_tables(from_date, table=scales.SALARY_SCALES,
     >>> import pkg_resources
     >>> import yaml
     >>> from ucamstaffoncosts.salary.scales import SalaryScaleTable
-    >>> table = SalaryScaleTable(yaml.load(pkg_resources.resource_string(
+    >>> table = SalaryScaleTable(yaml.safe_load(pkg_resources.resource_string(
     ...    'ucamstaffoncosts', 'data/example_salary_scales.yaml')))
     >>> from_date = datetime.date(2017, 5, 1)
     >>> mappings = salary_mapping_tables(from_date, table=table)
@@ -685,12 +722,14 @@ def salary_mapping_tables(from_date, table=scales.SALARY_SCALES,
     [True, True, True, True, True, True, True, True]
 
     """
-    # Find the dates for which we have an exact mapping from point to salary.
-    exact_dates = set(table.point_to_salary_map_effective_dates())
+    # Find the exact mappings from point to salary keyed by their effective dates.
+    exact_mappings = {
+        date: table.point_to_salary_map_for_date(date)[1]
+        for date in table.point_to_salary_map_effective_dates()
+    }
 
     # And the latest date from those
-    latest_exact_date = max(exact_dates)
-    _, latest_exact_mapping = table.point_to_salary_map_for_date(latest_exact_date)
+    latest_exact_date = max(exact_mappings)
 
     # Determine the month and day of increments
     negotiated_annual_change_month = (
@@ -718,17 +757,31 @@ def salary_mapping_tables(from_date, table=scales.SALARY_SCALES,
                                     negotiated_annual_change_day)
 
         # Is this year one for which we have an exact mapping? If so, use that
-        if change_date in exact_dates:
-            _, mapping = table.point_to_salary_map_for_date(change_date)
+        mapping = exact_mappings.get(change_date)
+        if mapping is not None:
             yield change_date, mapping, False
             continue
 
-        # Otherwise, we need to interpolate. Determine the multiplier for this year:
-        year_delta = year - latest_exact_date.year
-        multiplier = approximate_negotiated_annual_change ** year_delta
+        # Otherwise, yield an approximate table relative to the latest exact one.
+        yield change_date, _approximate_mapping(
+            table, latest_exact_date, approximate_negotiated_annual_change,
+            year - latest_exact_date.year), True
+
+
+@functools.lru_cache(maxsize=256)
+def _approximate_mapping(table, latest_exact_date, annual_change, year_delta):
+    """
+    Return the approximate point to salary mapping *year_delta* years on from the exact mapping in
+    *table* effective from *latest_exact_date*. Many progressions are modelled against the same
+    table and so the mappings are memoised rather than being rebuilt for each one. As with exact
+    mappings, callers must not modify the returned dict.
+
+    """
+    _, latest_exact_mapping = table.point_to_salary_map_for_date(latest_exact_date)
+    multiplier = annual_change ** year_delta
 
-        # Yield an approximate table. Note that we round all approximate salaries.
-        yield change_date, {
-            point: int(round(salary * multiplier))
-            for point, salary in latest_exact_mapping.items()
-        }, True
+    # Note that we round all approximate salaries.
+    return {
+        point: int(round(salary * multiplier))
+        for point, salary in latest_exact_mapping.items()
+    }
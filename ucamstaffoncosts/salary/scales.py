@@ -76,6 +76,7 @@ datetime.date(2017, 8, 1)
 True
 
 """
+import bisect
 import enum
 import collections
 import datetime
@@ -83,6 +84,10 @@ import datetime
 import pkg_resources
 import yaml
 
+#: YAML loader used for salary scale tables. The tables are plain data and so the safe loader is
+#: used. The libyaml-backed loader is preferred if PyYAML was built with it.
+_YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
 
 @enum.unique
 class Grade(enum.Enum):
@@ -158,6 +163,19 @@ class SalaryScaleTable:
         <../ucamstaffoncosts/data/example_salary_scales.yaml>` used in this documentation.
     :type data: dict
 
+    The scale for a grade may be given either as a list of rows, as in the example, or as a
+    dictionary of parallel lists of row fields:
+
+    >>> table = SalaryScaleTable({
+    ...     'grades': [{'name': 'GRADE_1', 'scale': {
+    ...         'isContribution': [False, True], 'names': ['X1', 'X2'], 'points': ['P1', 'P2'],
+    ...     }}],
+    ...     'salaries': [],
+    ... })
+    >>> table.scale_for_grade(Grade.GRADE_1) # doctest: +NORMALIZE_WHITESPACE
+    [ScaleRow(name='X1', point='P1', is_contribution=False),
+    ScaleRow(name='X2', point='P2', is_contribution=True)]
+
     """
 
     _ScaleRow = collections.namedtuple('ScaleRow', 'name point is_contribution')
@@ -182,26 +200,56 @@ class SalaryScaleTable:
             increments.
 
         """
+        __slots__ = ()
 
     def __init__(self, data):
         self._data = data
 
-        def to_row(item):
-            return SalaryScaleTable.ScaleRow(
-                name=item['name'], point=item['point'], is_contribution=item['isContribution']
-            )
+        def to_rows(scale):
+            # Scales written as parallel lists of row fields are transposed into rows.
+            if isinstance(scale, dict):
+                return [
+                    SalaryScaleTable.ScaleRow(
+                        name=name, point=point, is_contribution=is_contribution)
+                    for name, point, is_contribution in zip(
+                        scale['names'], scale['points'], scale['isContribution'])
+                ]
+
+            return [
+                SalaryScaleTable.ScaleRow(
+                    name=row['name'], point=row['point'], is_contribution=row['isContribution'])
+                for row in scale
+            ]
 
         # Construct a dictionary mapping Grade values into lists of ScaleRows.
         self._scales_by_grade = {
-            getattr(Grade, item['name']): [to_row(row) for row in item['scale']]
+            getattr(Grade, item['name']): to_rows(item['scale'])
             for item in self._data['grades']
         }
 
-        # Mappings are sorted by *descending* date
+        # Construct a dictionary mapping Grade values into dictionaries mapping each spine point in
+        # the grade to its annual increment. Employees do not advance from the last point on the
+        # scale, from a contribution point or on to a contribution point.
+        self._increments_by_grade = {}
+        for grade, scale in self._scales_by_grade.items():
+            increments = self._increments_by_grade[grade] = {}
+            for row, next_row in zip(scale, scale[1:] + [None]):
+                if next_row is None or row.is_contribution or next_row.is_contribution:
+                    increments.setdefault(row.point, row.point)
+                else:
+                    increments.setdefault(row.point, next_row.point)
+
+        # Mappings are (effective date, mapping) pairs sorted by *descending* date. Tables written
+        # as JSON record effective dates as ISO 8601 strings and so these are parsed here.
         self._mappings = sorted(
-            self._data['salaries'], key=lambda item: item['effectiveDate'], reverse=True
+            ((_parse_date(item['effectiveDate']), item['mapping'])
+             for item in self._data['salaries']),
+            key=lambda item: item[0], reverse=True
         )
 
+        # The effective dates in *ascending* order so that they may be bisected.
+        self._mapping_dates = [date for date, _ in reversed(self._mappings)]
+
     def increment(self, grade, point):
         """
         Return the salary scale point which is the next annual increment from the specified grade
@@ -255,30 +303,12 @@ class SalaryScaleTable:
         if grade is None:
             return point
 
-        # Get salary scale for grade
-        scale = self.scale_for_grade(grade)
-
-        # Find index of the specified point in the grade
-        index, current_row = next(
-            ((i, row) for i, row in enumerate(scale) if row.point == point), (None, None)
-        )
-        if index is None:
+        # Look up the increment for the specified point in the grade
+        next_point = self._increments_by_grade[grade].get(point)
+        if next_point is None:
             raise ValueError(f'point "{point!s}" is not part of grade "{grade!s}"')
 
-        # If this is the last point on the scale, or if this is a contribution point, there is no
-        # increment
-        if index == len(scale) - 1 or current_row.is_contribution:
-            return point
-
-        # Otherwise, find the next row
-        next_row = scale[index + 1]
-
-        # If *this* is a contribution point then the employee does not automatically advance
-        if next_row.is_contribution:
-            return point
-
-        # Otherwise, return the next point
-        return next_row.point
+        return next_point
 
     def scale_for_grade(self, grade):
         """
@@ -324,7 +354,7 @@ class SalaryScaleTable:
         [datetime.date(2017, 8, 1), datetime.date(2016, 8, 1)]
 
         """
-        return [mapping['effectiveDate'] for mapping in self._mappings]
+        return self._mapping_dates[::-1]
 
     def point_to_salary_map_for_date(self, date=None):
         """
@@ -386,24 +416,69 @@ class SalaryScaleTable:
         if date is None:
             date = datetime.datetime.now().date()
 
-        # Iterate through mapping tables until we find the first table whose effective date is on
-        # or before the target date. Since the mapping table is sorted by descending date, this
-        # will be the most recent table for that date. We iterate through in reverse order like
-        # this so that the common case (give me the most recent one) is efficient.
-        for mapping in self._mappings:
-            if mapping['effectiveDate'] <= date:
-                return mapping['effectiveDate'], mapping['mapping']
+        # Find the most recent table whose effective date is on or before the target date. Since
+        # the mapping tables are sorted by descending date, the index into the ascending list of
+        # dates is converted to an index into the mapping tables.
+        index = bisect.bisect_right(self._mapping_dates, date)
 
         # If no mapping was found, complain.
-        raise ValueError('date is too far in the past')
+        if index == 0:
+            raise ValueError('date is too far in the past')
+
+        return self._mappings[len(self._mappings) - index]
+
+
+def _parse_date(value):
+    """
+    Return *value* as a :py:class:`datetime.date`. Strings are parsed as ISO 8601 dates.
+
+    >>> _parse_date('2017-08-01')
+    datetime.date(2017, 8, 1)
+    >>> _parse_date(datetime.date(2017, 8, 1))
+    datetime.date(2017, 8, 1)
+
+    """
+    if isinstance(value, str):
+        return datetime.datetime.strptime(value, '%Y-%m-%d').date()
+    return value
+
+
+class _ResourceSalaryScaleTable(SalaryScaleTable):
+    """
+    A :py:class:`~.SalaryScaleTable` whose data is loaded from a package resource the first time it
+    is used. This means that importing the package does not require parsing every table.
+
+    :param resource_name: name of YAML resource within the ``ucamstaffoncosts`` package
+    :type resource_name: str
+
+    >>> table = _ResourceSalaryScaleTable('data/example_salary_scales.yaml')
+    >>> '_data' in table.__dict__
+    False
+    >>> table.starting_point_for_grade(Grade.GRADE_2)
+    'P3'
+    >>> '_data' in table.__dict__
+    True
+
+    """
+    def __init__(self, resource_name):
+        self._resource_name = resource_name
+
+    def __getattr__(self, name):
+        # __getattr__ is only called for attributes which have not been set and so, once the
+        # table is loaded, this is not called for the table attributes. Any other name loads the
+        # table and is then retried, except for dunder names (such as those probed by copy and
+        # pickle), the resource name itself and names which are still missing after loading.
+        if (name == '_resource_name' or (name.startswith('__') and name.endswith('__'))
+                or '_data' in self.__dict__):
+            raise AttributeError(name)
+        super().__init__(yaml.load(pkg_resources.resource_string(
+            'ucamstaffoncosts', self._resource_name), Loader=_YAML_LOADER))
+        return getattr(self, name)
 
 
-EXAMPLE_SALARY_SCALES = SalaryScaleTable(yaml.load(pkg_resources.resource_string(
-    'ucamstaffoncosts', 'data/example_salary_scales.yaml')))
+EXAMPLE_SALARY_SCALES = _ResourceSalaryScaleTable('data/example_salary_scales.yaml')
 
 
-SALARY_SCALES = SalaryScaleTable(
-    yaml.load(pkg_resources.resource_string('ucamstaffoncosts', 'data/salary_scales.yaml')))
+SALARY_SCALES = _ResourceSalaryScaleTable('data/salary_scales.yaml')
 
-CLINICAL_SCALES = SalaryScaleTable(
-    yaml.load(pkg_resources.resource_string('ucamstaffoncosts', 'data/clinical_scales.yaml')))
+CLINICAL_SCALES = _ResourceSalaryScaleTable('data/clinical_scales.yaml')
@@ -11,31 +11,44 @@ def _make_nic_calculator(boundaries):
 
     Returns a function which takes a base salary as input and returns the employer NIC.
 
+    >>> calculate = _make_nic_calculator(((100, 0), (None, fractions.Fraction(1, 10))))
+    >>> calculate(50), calculate(150), calculate(fractions.Fraction(301, 2))
+    (Fraction(0, 1), Fraction(5, 1), Fraction(101, 20))
+
     """
+    # Rates are scaled to a common denominator so that contributions can be accumulated as an
+    # integer numerator with a single division at the end.
+    rate_fractions = [fractions.Fraction(rate) for _, rate in boundaries]
+    denominator = 1
+    for rate in rate_fractions:
+        denominator = denominator * rate.denominator // math.gcd(denominator, rate.denominator)
+
+    # Each band is a (bottom, top, scaled rate) tuple. Note: top being None signals "infinity"
+    bands = []
+    boundary_bottom = 0
+    for (boundary_top, _), rate in zip(boundaries, rate_fractions):
+        bands.append((
+            boundary_bottom, boundary_top, rate.numerator * (denominator // rate.denominator)))
+        boundary_bottom = boundary_top
+
     def calculate(base_salary):
         # Make sure base salary is rational
-        base_salary = fractions.Fraction(base_salary)
-
-        # Keep track of bottom of current boundary
-        boundary_bottom = fractions.Fraction(0)
-
-        # Keep track of total NIC
-        contribution = fractions.Fraction(0)
+        if not isinstance(base_salary, (int, fractions.Fraction)):
+            base_salary = fractions.Fraction(base_salary)
 
-        for boundary_top, rate in boundaries:
-            # Note: boundary_top being None signals "infinity"
+        # Work with the base salary's numerator and scale the boundaries by its denominator.
+        salary, scale = base_salary.numerator, base_salary.denominator
 
-            if boundary_top is not None and base_salary >= boundary_top:
-                # Salary entirely encompasses this entire range
-                contribution += (boundary_top-boundary_bottom) * rate
-            elif base_salary > boundary_bottom and (boundary_top is None
-                                                    or base_salary < boundary_top):
-                # Salary is in top-most range
-                contribution += (base_salary-boundary_bottom) * rate
+        # Keep track of the numerator of the total NIC
+        contribution = 0
 
-            boundary_bottom = boundary_top
+        for boundary_bottom, boundary_top, rate in bands:
+            # The salary is clamped to the band. If the salary is below the band, no NIC is due on
+            # it and if it is above the band, NIC is due on the entire band.
+            band_top = salary if boundary_top is None else min(salary, boundary_top * scale)
+            contribution += max(0, band_top - boundary_bottom * scale) * rate
 
-        return contribution
+        return fractions.Fraction(contribution, scale * denominator)
 
     return calculate
 
@@ -63,5 +76,16 @@ def standard_apprenticeship_levy(base_salary):
     Return the standard Apprenticeship Levy assuming no special circumstances. Note that HR round
     this figure *down* in on-costs tables.
 
+    >>> standard_apprenticeship_levy(25000), standard_apprenticeship_levy(25199)
+    (125, 125)
+    >>> standard_apprenticeship_levy(fractions.Fraction(51001, 2))
+    127
+
     """
-    return math.floor(base_salary * rates.APPRENTICESHIP_LEVY_RATE)
+    rate = rates.APPRENTICESHIP_LEVY_RATE
+
+    # Integer salaries can be scaled by the rate and rounded down using integer arithmetic alone.
+    if type(base_salary) is int:
+        return (base_salary * rate.numerator) // rate.denominator
+
+    return math.floor(base_salary * rate)
@@ -15,15 +15,18 @@ The following normalisation is used:
 import csv
 import sys
 
+#: Translation table which strips commas.
+STRIP_COMMAS = str.maketrans('', '', ',')
+
 
 def normalise(cell):
-    return cell.strip().replace(',', '').lstrip('0')
+    return cell.strip().translate(STRIP_COMMAS).lstrip('0')
 
 
 def main():
     reader = csv.reader(sys.stdin, dialect='excel-tab')
     writer = csv.writer(sys.stdout)
-    writer.writerows([normalise(cell) for cell in row] for row in reader if len(row) > 0)
+    writer.writerows((normalise(cell) for cell in row) for row in reader if len(row) > 0)
 
 
 if __name__ == '__main__':
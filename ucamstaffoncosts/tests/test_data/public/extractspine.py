@@ -6,12 +6,19 @@ import csv
 import re
 import sys
 
+#: Pattern matching a numeric spine point.
+SPINE_POINT_PATTERN = re.compile('^[0-9]+$')
+
+#: Translation table which strips commas and pound signs from salaries.
+STRIP_SALARY_CHARS = str.maketrans('', '', ',£')
+
 
 def main():
     reader = csv.reader(sys.stdin)
     writer = csv.writer(sys.stdout)
 
-    writer.writerow(['Scale point', 'Salary (£)'])
+    writerow = writer.writerow
+    writerow(['Scale point', 'Salary (£)'])
 
     for row in reader:
         # Extract values
@@ -26,14 +33,13 @@ def main():
             continue
 
         # ...and it is numeric
-        if not re.match('^[0-9]+$', spine_point_1):
+        if not SPINE_POINT_PATTERN.match(spine_point_1):
             continue
 
         # Strip characters from salary
-        base_salary = base_salary.replace(',', '')
-        base_salary = base_salary.replace('£', '')
+        base_salary = base_salary.translate(STRIP_SALARY_CHARS)
 
-        writer.writerow([spine_point_1, base_salary])
+        writerow([spine_point_1, base_salary])
 
 
 if __name__ == '__main__':
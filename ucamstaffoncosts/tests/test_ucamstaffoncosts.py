@@ -1,6 +1,9 @@
 import csv
+import fractions
+import functools
 import hashlib
 import io
+import itertools
 import os
 import unittest.mock as mock
 
@@ -14,13 +17,6 @@ PUBLIC_DATA_DIR = os.path.join(TEST_DATA_DIR, 'public')
 PRIVATE_DATA_DIR = os.path.join(TEST_DATA_DIR, 'private')
 
 
-# Load the SHA256 hashes of the correct tables from the private data directory. A dictionary keyed
-# by original file name giving the hash of the correct file.
-PRIVATE_DATA_HASHES = dict(
-    line.split()[::-1] for line in open(os.path.join(PRIVATE_DATA_DIR, 'on-costs-hashes.txt'))
-)
-
-
 def test_not_implemented_scheme():
     """Check NotImplementedError is raised if the scheme is unknown."""
 
@@ -106,6 +102,37 @@ def test_default_scheme():
             'nhs_2018.csv', with_exchange_column=True)
 
 
+def test_calculate_costs():
+    """Check batch on-costs match those calculated individually."""
+    _, spine_rows = read_spine_points()
+    base_salaries = [int(base_salary) for _, base_salary in spine_rows]
+    for scheme in [costs.Scheme.USS_EXCHANGE, costs.Scheme.NHS]:
+        nose.tools.assert_equal(
+            costs.calculate_costs(base_salaries, scheme, 2018),
+            [costs.calculate_cost(s, scheme, 2018) for s in base_salaries])
+
+    with nose.tools.assert_raises(NotImplementedError):
+        costs.calculate_costs([100], 'this-is-not-a-pension-scheme', 2018)
+
+
+def test_excel_round():
+    """Check Excel rounding rounds halves up, including for negative values."""
+    half = fractions.Fraction(1, 2)
+    for value, expected in [
+            (3, 3), (-3, -3), (True, 1),
+            (fractions.Fraction(7, 2), 4), (fractions.Fraction(-7, 2), -3),
+            (fractions.Fraction(7, 3), 2), (fractions.Fraction(-7, 3), -2),
+            (2.5, 3), (-2.5, -2), (-2.6, -3)]:
+        result = costs._excel_round(value)
+        nose.tools.assert_equal(result, expected)
+        nose.tools.assert_is(type(result), int)
+
+    # Halves round up and so negating either side of the rounding gives a different result. This
+    # is why the cost calculator rounds the exchange both ways.
+    nose.tools.assert_equal(costs._excel_round(-half), 0)
+    nose.tools.assert_equal(-costs._excel_round(half), -1)
+
+
 def assert_generator_matches_table(on_cost_generator, table_filename, with_exchange_column=False):
     """
     Take a generator callable which returns an OnCost from a base salary and check that its output
@@ -114,6 +141,7 @@ def assert_generator_matches_table(on_cost_generator, table_filename, with_excha
 
     """
     headings, spine_rows = read_spine_points()
+    headings = list(headings)
 
     if with_exchange_column:
         headings.append('Exchange (£)')
@@ -152,51 +180,71 @@ def assert_tables_match(table_contents, filename):
     object.
 
     """
-    expected_hash, expected_table_contents = read_table(filename)
+    expected_hash, load_expected_table = read_table(filename)
+    table_hash = hashlib.sha256(table_contents).hexdigest()
 
-    # If we have the expected table, compare it directly.
+    # If the hashes differ and we have the expected table, compare it directly to show where the
+    # tables differ. The expected table is only read in this case.
+    expected_table_contents = load_expected_table() if table_hash != expected_hash else None
     if expected_table_contents is not None:
         # Compare line-wise
-        for line, expected_line in zip(table_contents.decode('utf8').splitlines(),
-                                       expected_table_contents.decode('utf8').splitlines()):
+        for line, expected_line in itertools.zip_longest(
+                table_contents.decode('utf8').splitlines(),
+                expected_table_contents.decode('utf8').splitlines()):
             nose.tools.assert_equal(line, expected_line)
 
         # Compare byte-wise
         nose.tools.assert_equal(table_contents, expected_table_contents)
 
     # Compare the hashes
-    table_hash = hashlib.sha256(table_contents).hexdigest()
     nose.tools.assert_equal(table_hash, expected_hash)
 
 
+@functools.lru_cache(maxsize=None)
 def read_spine_points():
     """
-    Return table header and a sequence of rows from the spine points table.
+    Return table header and a sequence of rows from the spine points table. The table is only read
+    once and so the header and rows are returned as tuples which cannot be modified.
 
     """
     with open(os.path.join(PUBLIC_DATA_DIR, 'spine_points_august_2017.csv')) as f:
         reader = csv.reader(f)
         headings = next(reader)
-        return headings, list(reader)
+        return tuple(headings), tuple(tuple(row) for row in reader)
 
 
 def read_table(filename):
     """
-    Return the hash of the filename and its contents if present in the TEST_DATA_DIR directory. If
-    the file is not present, the contents are returned as None.
+    Return the hash of the filename and a callable which returns its contents if present in the
+    TEST_DATA_DIR directory. If the file is not present, the callable returns None. The file is
+    only read when the callable is called.
 
     The file itself may not be present as the contents are private.
 
     """
-    hash_value = PRIVATE_DATA_HASHES[filename]
+    hash_value = read_private_data_hashes()[filename]
     abs_path = os.path.join(PRIVATE_DATA_DIR, filename)
 
-    # Return hash file contents if the file can be read, otherwise return hash and None.
-    try:
-        with open(abs_path, 'rb') as f:
-            return hash_value, f.read()
-    except IOError:
-        return hash_value, None
+    def load():
+        # Return file contents if the file can be read, otherwise return None.
+        try:
+            with open(abs_path, 'rb') as f:
+                return f.read()
+        except IOError:
+            return None
+
+    return hash_value, load
+
+
+@functools.lru_cache(maxsize=None)
+def read_private_data_hashes():
+    """
+    Return the SHA256 hashes of the correct tables from the private data directory. A dictionary
+    keyed by original file name giving the hash of the correct file. The hashes are only read once.
+
+    """
+    with open(os.path.join(PRIVATE_DATA_DIR, 'on-costs-hashes.txt')) as f:
+        return dict(line.split()[::-1] for line in f)
 
 
 def blank_if_zero(value):
@@ -2,6 +2,40 @@
 General utility functions.
 
 """
+import calendar
+import itertools
+
+
+def pairwise(iterable):
+    """
+    Return an iterator over successive overlapping pairs taken from *iterable*. This is the
+    ``pairwise`` recipe from the :py:mod:`itertools` documentation. Unlike zipping a sequence with
+    a slice of itself it does not copy the sequence.
+
+    >>> list(pairwise([1, 2, 3, 4]))
+    [(1, 2), (2, 3), (3, 4)]
+    >>> list(pairwise([1]))
+    []
+
+    """
+    a, b = itertools.tee(iterable)
+    next(b, None)
+    return zip(a, b)
+
+
+def tax_year_days(year, start_month=4):
+    """
+    Return the number of days in the tax year which starts in *start_month* of *year*. A tax year
+    includes the 29th February of the year it starts in if it starts before March and of the
+    following year otherwise.
+
+    >>> tax_year_days(2018), tax_year_days(2019)
+    (365, 366)
+    >>> tax_year_days(2020, 1), tax_year_days(2020, 3)
+    (366, 365)
+
+    """
+    return 366 if calendar.isleap(year if start_month < 3 else year + 1) else 365
 
 
 def pprinttable(rows):
@@ -18,20 +52,17 @@ def pprinttable(rows):
     1   | 2   | 3
     """
     headers = rows[0]._fields
-    lens = []
-    for i in range(len(rows[0])):
-        lens.append(
-            len(max([str(x[i]) for x in rows] + [headers[i]], key=lambda x: len(str(x)))))
-    formats = []
-    hformats = []
-    for i in range(len(rows[0])):
-        formats.append("%%-%ds" % lens[i])
-        hformats.append("%%-%ds" % lens[i])
-    pattern = " | ".join(formats)
-    hpattern = " | ".join(hformats)
-    separator = "-+-".join(['-' * n for n in lens])
-    print(hpattern % tuple(headers))
-    print(separator)
 
-    for line in rows:
-        print(pattern % tuple(str(t) for t in line))
+    # Convert each cell to a string once and use the strings both for column widths and output.
+    str_rows = [[str(t) for t in line] for line in rows]
+    lens = [
+        max(len(header), *(len(str_row[i]) for str_row in str_rows))
+        for i, header in enumerate(headers)
+    ]
+
+    pattern = " | ".join("%%-%ds" % n for n in lens)
+    separator = "-+-".join(['-' * n for n in lens])
+    print("\n".join(
+        [pattern % tuple(headers), separator]
+        + [pattern % tuple(str_row) for str_row in str_rows]
+    ))